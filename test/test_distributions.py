@@ -1569,6 +1569,7 @@ class TestKL(TestCase):
             (Chi2(2), Gamma(3, 4)),
             (Chi2(2), Exponential(3)),
             (Dirichlet(torch.Tensor([1, 2])), Dirichlet(torch.Tensor([3, 4]))),
+            (Dirichlet(torch.Tensor([[1, 2], [3, 4], [5, 6]])), Dirichlet(torch.Tensor([[3, 4], [1, 2], [2, 2]]))),
             (Exponential(1), Chi2(2)),
             (Exponential(1), Exponential(2)),
             (Exponential(1), Gamma(2, 3)),
@@ -1590,8 +1591,10 @@ class TestKL(TestCase):
             (Pareto(1, 2), Gamma(3, 4)),  # This case fails for n <= 22000
             (Pareto(1, 2), Laplace(-3, 4)),
             (Pareto(1, 2), Laplace(3, 4)),
+            (Pareto(torch.Tensor([1, 1]), torch.Tensor([2, 2])), Laplace(torch.Tensor([-3, 3]), torch.Tensor([4, 4]))),
             (Pareto(1, 3), Normal(-2, 4)),
             (Uniform(0.25, 0.75), Beta(3, 4)),
+            (Uniform(0, 0.5), Beta(3, 4)),
             (Uniform(1, 2), Chi2(3)),
             (Uniform(1, 2), Exponential(3)),
             (Uniform(1, 2), Gamma(3, 4)),
@@ -1657,6 +1660,19 @@ class TestKL(TestCase):
                 type(p).__name__, type(q).__name__, expected, actual)
             self.assertEqual(expected, actual, prec=0.1, message=message)
 
+    def test_kl_identical(self):
+        for p, _ in self.finite_examples:
+            self.assertTrue((kl_divergence(p, p) == 0).all(),
+                            'Incorrect KL({0}, {0})'.format(type(p).__name__))
+
+    def test_kl_beta_backward_twice(self):
+        concentration1 = Variable(torch.Tensor([1, 2]), requires_grad=True)
+        concentration0 = Variable(torch.Tensor([3, 4]), requires_grad=True)
+        p = Beta(concentration1, concentration0)
+        q = Beta(2, 3)
+        for _ in range(2):
+            (kl_divergence(p, q) - p.entropy()).sum().backward()
+
     def test_kl_infinite(self):
         for p, q in self.infinite_examples:
             self.assertTrue((kl_divergence(p, q) == float('inf')).all(),
@@ -1,6 +1,7 @@
 from numbers import Number
 
 import torch
+from torch.autograd import Variable
 from torch.distributions import constraints
 from torch.distributions.dirichlet import Dirichlet
 from torch.distributions.distribution import Distribution
@@ -35,6 +36,7 @@ class Beta(Distribution):
             concentration1, concentration0 = broadcast_all(concentration1, concentration0)
             concentration1_concentration0 = torch.stack([concentration1, concentration0], -1)
         self._dirichlet = Dirichlet(concentration1_concentration0)
+        self._digamma_cache = {}
         super(Beta, self).__init__(self._dirichlet._batch_shape)
 
     def rsample(self, sample_shape=()):
@@ -49,7 +51,11 @@ class Beta(Distribution):
         return self._dirichlet.log_prob(heads_tails)
 
     def entropy(self):
-        return self._dirichlet.entropy()
+        total = self.concentration1 + self.concentration0
+        return (self.concentration1.lgamma() + self.concentration0.lgamma() - total.lgamma() -
+                (self.concentration1 - 1) * self._digamma_concentration1 -
+                (self.concentration0 - 1) * self._digamma_concentration0 +
+                (total - 2) * self._digamma_total)
 
     @property
     def concentration1(self):
@@ -66,3 +72,25 @@ class Beta(Distribution):
             return torch.Tensor([result])
         else:
             return result
+
+    def _cached_digamma(self, name, get_value):
+        # A cached Variable would hold a graph whose buffers the first backward() frees,
+        # so only cache when the concentrations do not require grad.
+        concentration = self._dirichlet.concentration
+        if isinstance(concentration, Variable) and concentration.requires_grad:
+            return get_value().digamma()
+        if name not in self._digamma_cache:
+            self._digamma_cache[name] = get_value().digamma()
+        return self._digamma_cache[name]
+
+    @property
+    def _digamma_concentration1(self):
+        return self._cached_digamma('concentration1', lambda: self.concentration1)
+
+    @property
+    def _digamma_concentration0(self):
+        return self._cached_digamma('concentration0', lambda: self.concentration0)
+
+    @property
+    def _digamma_total(self):
+        return self._cached_digamma('total', lambda: self.concentration1 + self.concentration0)
@@ -1,5 +1,5 @@
+import threading
 import warnings
-from functools import total_ordering
 
 import torch
 import math
@@ -19,7 +19,9 @@ from .pareto import Pareto
 from .uniform import Uniform
 
 _KL_REGISTRY = {}  # Source of truth mapping a few general (type, type) pairs to functions.
-_KL_MEMOIZE = {}  # Memoized version mapping many specific (type, type) pairs to functions.
+_KL_MEMOIZE = {}  # Memoized version mapping many specific types p to {type q: function} dicts.
+_KL_DISPATCH_ORDER = []  # Registry keys with their __mro__ depths, sorted most-specific first.
+_KL_LOCK = threading.Lock()  # Guards mutation of the above; reads of _KL_MEMOIZE are lock-free.
 
 
 def register_kl(type_p, type_q):
@@ -54,43 +56,49 @@ def register_kl(type_p, type_q):
         raise TypeError('Expected type_q to be a Distribution subclass but got {}'.format(type_q))
 
     def decorator(fun):
-        _KL_REGISTRY[type_p, type_q] = fun
-        _KL_MEMOIZE.clear()  # reset since lookup order may have changed
+        global _KL_DISPATCH_ORDER
+        with _KL_LOCK:
+            _KL_REGISTRY[type_p, type_q] = fun
+            _KL_MEMOIZE.clear()  # reset since lookup order may have changed
+            _KL_DISPATCH_ORDER = _sort_registry()
         return fun
 
     return decorator
 
 
-@total_ordering
-class _Match(object):
-    __slots__ = ['types']
-
-    def __init__(self, *types):
-        self.types = types
-
-    def __eq__(self, other):
-        return self.types == other.types
-
-    def __le__(self, other):
-        for x, y in zip(self.types, other.types):
-            if not issubclass(x, y):
-                return False
-            if x is not y:
-                break
-        return True
+def _sort_registry():
+    """
+    Returns ``(depth_p, depth_q, super_p, super_q)`` for each registry key,
+    sorted lexicographically by decreasing depth. Under single inheritance,
+    subclass order among the keys matching a given (type, type) pair agrees
+    with the length of ``__mro__``, so the first match is the most specific
+    on p and then on q.
+    """
+    entries = [(len(super_p.__mro__), len(super_q.__mro__), super_p, super_q)
+               for super_p, super_q in _KL_REGISTRY]
+    return sorted(entries, key=lambda e: (-e[0], -e[1]))
 
 
 def _dispatch_kl(type_p, type_q):
     """
     Find the most specific approximate match, assuming single inheritance.
     """
-    matches = [(super_p, super_q) for super_p, super_q in _KL_REGISTRY
-               if issubclass(type_p, super_p) and issubclass(type_q, super_q)]
-    if not matches:
+    mro_p = set(type_p.__mro__)
+    mro_q = set(type_q.__mro__)
+    left = right = None
+    for depth_p, depth_q, super_p, super_q in _KL_DISPATCH_ORDER:
+        if super_p in mro_p and super_q in mro_q:
+            if left is None:
+                left = right = super_p, super_q
+                right_depth_q = depth_q
+            elif depth_q > right_depth_q:
+                # Later matches are no deeper in p, so this is the first match ordered by (q, p).
+                right = super_p, super_q
+                right_depth_q = depth_q
+    if left is None:
         return NotImplemented
     # Check that the left- and right- lexicographic orders agree.
-    left_p, left_q = min(_Match(*m) for m in matches).types
-    right_q, right_p = min(_Match(*reversed(m)) for m in matches).types
+    (left_p, left_q), (right_p, right_q) = left, right
     left_fun = _KL_REGISTRY[left_p, left_q]
     right_fun = _KL_REGISTRY[right_p, right_q]
     if left_fun is not right_fun:
@@ -100,18 +108,44 @@ def _dispatch_kl(type_p, type_q):
     return left_fun
 
 
+# Parameter whose shape and type match the batch of each distribution, where there is one.
+_BATCH_SHAPE_ATTR = {
+    Bernoulli: 'probs',
+    Beta: 'concentration1',
+    Binomial: 'probs',
+    Exponential: 'rate',
+    Gamma: 'concentration',
+    Geometric: 'probs',
+    Gumbel: 'loc',
+    Laplace: 'loc',
+    Normal: 'loc',
+    Pareto: 'scale',
+    Uniform: 'low',
+}
+
+
+def _batch_shape_tensor(dist):
+    """
+    Returns a parameter of `dist` shaped like its batch, or None if unknown.
+    """
+    for cls in type(dist).__mro__:
+        if cls in _BATCH_SHAPE_ATTR:
+            return getattr(dist, _BATCH_SHAPE_ATTR[cls])
+    return None
+
+
 def _infinite_like(tensor):
     """
     Helper function for obtaining infinite KL Divergence throughout
     """
-    return tensor.new([float('inf')]).expand_as(tensor)
+    return tensor.new(tensor.size()).fill_(float('inf'))
 
 
 def _x_log_x(tensor):
     """
-    Utility function for calculating x log x
+    Utility function for calculating x log x, taking 0 log 0 = 0
     """
-    return tensor * tensor.log()
+    return (tensor * tensor.log()).masked_fill_(tensor == 0, 0)
 
 
 def kl_divergence(p, q):
@@ -134,12 +168,20 @@ def kl_divergence(p, q):
             :meth:`register_kl`.
     """
     try:
-        fun = _KL_MEMOIZE[type(p), type(q)]
+        fun = _KL_MEMOIZE[type(p)][type(q)]
     except KeyError:
-        fun = _dispatch_kl(type(p), type(q))
-        _KL_MEMOIZE[type(p), type(q)] = fun
+        with _KL_LOCK:
+            memo = _KL_MEMOIZE.setdefault(type(p), {})
+            fun = memo.get(type(q))
+            if fun is None:  # another thread may have dispatched while we waited for the lock
+                fun = _dispatch_kl(type(p), type(q))
+                memo[type(q)] = fun
     if fun is NotImplemented:
         raise NotImplementedError
+    if p is q:
+        shape_tensor = _batch_shape_tensor(p)
+        if shape_tensor is not None:
+            return shape_tensor * 0  # keeps the (zero) gradient path to the parameters
     return fun(p, q)
 
 
@@ -148,6 +190,8 @@ def kl_divergence(p, q):
 ################################################################################
 
 _euler_gamma = 0.57721566490153286060
+_log_2pi = math.log(2 * math.pi)
+_log_2_over_pi = math.log(2 / math.pi)
 
 # Same distributions
 
@@ -165,9 +209,9 @@ def _kl_beta_beta(p, q):
     sum_params_q = q.concentration1 + q.concentration0
     t1 = q.concentration1.lgamma() + q.concentration0.lgamma() + (sum_params_p).lgamma()
     t2 = p.concentration1.lgamma() + p.concentration0.lgamma() + (sum_params_q).lgamma()
-    t3 = (p.concentration1 - q.concentration1) * torch.digamma(p.concentration1)
-    t4 = (p.concentration0 - q.concentration0) * torch.digamma(p.concentration0)
-    t5 = (sum_params_q - sum_params_p) * torch.digamma(sum_params_p)
+    t3 = (p.concentration1 - q.concentration1) * p._digamma_concentration1
+    t4 = (p.concentration0 - q.concentration0) * p._digamma_concentration0
+    t5 = (sum_params_q - sum_params_p) * p._digamma_total
     return t1 - t2 + t3 + t4 + t5
 
 
@@ -186,41 +230,38 @@ def _kl_binomial_binomial(p, q):
 @register_kl(Dirichlet, Dirichlet)
 def _kl_dirichlet_dirichlet(p, q):
     # From http://bariskurt.com/kullback-leibler-divergence-between-two-dirichlet-and-beta-distributions/
-    sum_p_alpha = p.concentration.sum(-1)
+    sum_p_alpha = p.concentration.sum(-1, keepdim=True)
     sum_q_alpha = q.concentration.sum(-1)
-    t1 = torch.lgamma(sum_p_alpha)
-    t2 = torch.lgamma(sum_q_alpha)
-    t3 = p.concentration.lgamma().sum(-1)
-    t4 = q.concentration.lgamma().sum(-1)
-    t5 = (p.concentration - q.concentration) * (p.concentration.digamma() - sum_p_alpha.digamma())
-    return t1 - t3 - t2 + t4 + t5.sum(-1)
+    t1 = torch.lgamma(sum_p_alpha.squeeze(-1)) - torch.lgamma(sum_q_alpha)
+    t2 = q.concentration.lgamma() - p.concentration.lgamma()
+    # digamma returns a fresh tensor, so the broadcast difference can be taken in place.
+    digamma_diff = p.concentration.digamma().sub_(sum_p_alpha.digamma())
+    t3 = (p.concentration - q.concentration) * digamma_diff
+    return t1 + (t2 + t3).sum(-1)
 
 
 @register_kl(Exponential, Exponential)
 def _kl_exponential_exponential(p, q):
     rate_ratio = q.rate / p.rate
-    t1 = -rate_ratio.log()
-    return t1 + rate_ratio - 1
+    return rate_ratio - rate_ratio.log() - 1
 
 
 @register_kl(Gamma, Gamma)
 def _kl_gamma_gamma(p, q):
-    t1 = q.concentration * (p.rate / q.rate).log()
-    t2 = torch.lgamma(q.concentration) - torch.lgamma(p.concentration)
-    t3 = (p.concentration - q.concentration) * torch.digamma(p.concentration)
-    t4 = (q.rate - p.rate) * (p.concentration / p.rate)
-    return t1 + t2 + t3 + t4
+    rate_ratio = q.rate / p.rate
+    t1 = torch.lgamma(q.concentration) - torch.lgamma(p.concentration)
+    t2 = (p.concentration - q.concentration) * torch.digamma(p.concentration)
+    t3 = (rate_ratio - 1) * p.concentration - q.concentration * rate_ratio.log()
+    return t1 + t2 + t3
 
 
 @register_kl(Gumbel, Gumbel)
 def _kl_gumbel_gumbel(p, q):
     ct1 = p.scale / q.scale
-    ct2 = q.loc / q.scale
-    ct3 = p.loc / q.scale
-    t1 = -ct1.log() - ct2 + ct3
-    t2 = ct1 * _euler_gamma
-    t3 = torch.exp(ct2 + (1 + ct1).lgamma() - ct3)
-    return t1 + t2 + t3 - (1 + _euler_gamma)
+    ct2 = (p.loc - q.loc) / q.scale
+    t1 = ct1 * _euler_gamma + ct2 - ct1.log()
+    t2 = torch.exp((1 + ct1).lgamma() - ct2)
+    return t1 + t2 - (1 + _euler_gamma)
 
 
 @register_kl(Geometric, Geometric)
@@ -233,19 +274,16 @@ def _kl_laplace_laplace(p, q):
     # From http://www.mast.queensu.ca/~communications/Papers/gil-msc11.pdf
     scale_ratio = p.scale / q.scale
     loc_abs_diff = (p.loc - q.loc).abs()
-    t1 = -scale_ratio.log()
-    t2 = loc_abs_diff / q.scale
-    t3 = scale_ratio * torch.exp(-loc_abs_diff / p.scale)
-    return t1 + t2 + t3 - 1
+    t1 = loc_abs_diff / q.scale - scale_ratio.log()
+    t2 = scale_ratio * torch.exp(-loc_abs_diff / p.scale)
+    return t1 + t2 - 1
 
 
 @register_kl(Normal, Normal)
 def _kl_normal_normal(p, q):
-    std_dev_ratio = p.scale / q.scale
-    t1 = -std_dev_ratio.log()
-    t2 = std_dev_ratio.pow(2)
-    t3 = ((p.loc - q.loc) / q.scale).pow(2)
-    return t1 + (t2 + t3 - 1) / 2
+    ratio = p.scale / q.scale
+    t1 = ((p.loc - q.loc) / q.scale).pow(2)
+    return 0.5 * (ratio.pow(2) + t1 - 1) - ratio.log()
 
 
 @register_kl(Pareto, Pareto)
@@ -256,35 +294,58 @@ def _kl_pareto_pareto(p, q):
     t1 = q.alpha * scale_ratio.log()
     t2 = -alpha_ratio.log()
     result = t1 + t2 + alpha_ratio - 1
-    result[p.support.lower_bound < q.support.lower_bound] = float('inf')
-    return result
+    return result.masked_fill_(p.scale < q.scale, float('inf'))
 
 
 @register_kl(Uniform, Uniform)
 def _kl_uniform_uniform(p, q):
     result = ((q.high - q.low) / (p.high - p.low)).log()
-    result[(q.low > p.low) | (q.high < p.high)] = float('inf')
-    return result
+    return result.masked_fill_((q.low > p.low) | (q.high < p.high), float('inf'))
 
 # Different distributions
 
 
 @register_kl(Beta, Pareto)
-def _kl_beta_infinity(p, q):
-    return _infinite_like(p.concentration1)
+@register_kl(Exponential, Beta)
+@register_kl(Exponential, Pareto)
+@register_kl(Exponential, Uniform)
+@register_kl(Gamma, Beta)
+@register_kl(Gamma, Pareto)
+@register_kl(Gamma, Uniform)
+@register_kl(Gumbel, Beta)
+@register_kl(Gumbel, Exponential)
+@register_kl(Gumbel, Gamma)
+@register_kl(Gumbel, Pareto)
+@register_kl(Gumbel, Uniform)
+@register_kl(Laplace, Beta)
+@register_kl(Laplace, Exponential)
+@register_kl(Laplace, Gamma)
+@register_kl(Laplace, Pareto)
+@register_kl(Laplace, Uniform)
+@register_kl(Normal, Beta)
+@register_kl(Normal, Exponential)
+@register_kl(Normal, Gamma)
+@register_kl(Normal, Pareto)
+@register_kl(Normal, Uniform)
+@register_kl(Pareto, Beta)
+@register_kl(Pareto, Uniform)
+def _kl_infinity(p, q):
+    return _infinite_like(_batch_shape_tensor(p))
 
 
 @register_kl(Beta, Exponential)
 def _kl_beta_exponential(p, q):
-    return -p.entropy() - q.rate.log() + q.rate * (p.concentration1 / (p.concentration1 + p.concentration0))
+    sum_params_p = p.concentration1 + p.concentration0
+    return -p.entropy() - q.rate.log() + q.rate * (p.concentration1 / sum_params_p)
 
 
 @register_kl(Beta, Gamma)
 def _kl_beta_gamma(p, q):
+    sum_params_p = p.concentration1 + p.concentration0
     t1 = -p.entropy()
     t2 = q.concentration.lgamma() - q.concentration * q.rate.log()
-    t3 = (q.concentration - 1) * (p.concentration1.digamma() - (p.concentration1 + p.concentration0).digamma())
-    t4 = q.rate * p.concentration1 / (p.concentration1 + p.concentration0)
+    t3 = (q.concentration - 1) * (p._digamma_concentration1 - p._digamma_total)
+    t4 = q.rate * p.concentration1 / sum_params_p
     return t1 + t2 - t3 + t4
 
 # TODO: Add Beta-Laplace KL Divergence
@@ -292,11 +353,12 @@ def _kl_beta_gamma(p, q):
 
 @register_kl(Beta, Normal)
 def _kl_beta_normal(p, q):
-    E_beta = p.concentration1 / (p.concentration1 + p.concentration0)
+    sum_params_p = p.concentration1 + p.concentration0
+    E_beta = p.concentration1 / sum_params_p
     var_normal = q.scale.pow(2)
     t1 = -p.entropy()
-    t2 = 0.5 * (var_normal * 2 * math.pi).log()
-    t3 = (E_beta * (1 - E_beta) / (p.concentration1 + p.concentration0 + 1) + E_beta.pow(2)) * 0.5
+    t2 = q.scale.log() + 0.5 * _log_2pi
+    t3 = (E_beta * (1 - E_beta) / (sum_params_p + 1) + E_beta.pow(2)) * 0.5
     t4 = q.loc * E_beta
     t5 = q.loc.pow(2) * 0.5
     return t1 + t2 + (t3 - t4 + t5) / var_normal
@@ -305,15 +367,7 @@ def _kl_beta_normal(p, q):
 @register_kl(Beta, Uniform)
 def _kl_beta_uniform(p, q):
     result = -p.entropy() + (q.high - q.low).log()
-    result[(q.low > p.support.lower_bound) | (q.high < p.support.upper_bound)] = float('inf')
-    return result
-
-
-@register_kl(Exponential, Beta)
-@register_kl(Exponential, Pareto)
-@register_kl(Exponential, Uniform)
-def _kl_exponential_infinity(p, q):
-    return _infinite_like(p.rate)
+    return result.masked_fill_((q.low > p.support.lower_bound) | (q.high < p.support.upper_bound), float('inf'))
 
 
 @register_kl(Exponential, Gamma)
@@ -337,20 +391,13 @@ def _kl_exponential_gumbel(p, q):
 
 @register_kl(Exponential, Normal)
 def _kl_exponential_normal(p, q):
-    var_normal = q.scale.pow(2)
-    rate_sqr = p.rate.pow(2)
-    t1 = 0.5 * torch.log(rate_sqr * var_normal * 2 * math.pi)
-    t2 = rate_sqr.reciprocal()
-    t3 = q.loc / p.rate
-    t4 = q.loc.pow(2) * 0.5
-    return t1 - 1 + (t2 - t3 + t4) / var_normal
-
-
-@register_kl(Gamma, Beta)
-@register_kl(Gamma, Pareto)
-@register_kl(Gamma, Uniform)
-def _kl_gamma_infinity(p, q):
-    return _infinite_like(p.concentration)
+    scale_rate_prod = p.rate * q.scale
+    loc_scale_ratio = q.loc / q.scale
+    t1 = scale_rate_prod.log() + 0.5 * _log_2pi - 1
+    t2 = scale_rate_prod.reciprocal()
+    t3 = t2 * (t2 - loc_scale_ratio)
+    t4 = 0.5 * loc_scale_ratio.pow(2)
+    return t1 + t3 + t4
 
 
 @register_kl(Gamma, Exponential)
@@ -374,60 +421,33 @@ def _kl_gamma_gumbel(p, q):
 def _kl_gamma_normal(p, q):
     var_normal = q.scale.pow(2)
     beta_sqr = p.rate.pow(2)
-    t1 = 0.5 * torch.log(beta_sqr * var_normal * 2 * math.pi) - p.concentration - p.concentration.lgamma()
+    t1 = (p.rate * q.scale).log() + 0.5 * _log_2pi - p.concentration - p.concentration.lgamma()
     t2 = 0.5 * (p.concentration.pow(2) + p.concentration) / beta_sqr
     t3 = q.loc * p.concentration / p.rate
     t4 = 0.5 * q.loc.pow(2)
     return t1 + (p.concentration - 1) * p.concentration.digamma() + (t2 - t3 + t4) / var_normal
 
 
-@register_kl(Gumbel, Beta)
-@register_kl(Gumbel, Exponential)
-@register_kl(Gumbel, Gamma)
-@register_kl(Gumbel, Pareto)
-@register_kl(Gumbel, Uniform)
-def _kl_gumbel_infinity(p, q):
-    return _infinite_like(p.loc)
-
 # TODO: Add Gumbel-Laplace KL Divergence
 
 
 @register_kl(Gumbel, Normal)
 def _kl_gumbel_normal(p, q):
     param_ratio = p.scale / q.scale
-    t1 = (param_ratio / math.sqrt(2 * math.pi)).log()
-    t2 = (math.pi * param_ratio) / 12
+    t1 = param_ratio.log() - 0.5 * _log_2pi
+    t2 = param_ratio * (math.pi / 12)
     t3 = ((p.loc + p.scale * _euler_gamma - q.loc) / q.scale).pow(2) * 0.5
     return -t1 + t2 + t3 - (_euler_gamma + 1)
 
 
-@register_kl(Laplace, Beta)
-@register_kl(Laplace, Exponential)
-@register_kl(Laplace, Gamma)
-@register_kl(Laplace, Pareto)
-@register_kl(Laplace, Uniform)
-def _kl_laplace_infinity(p, q):
-    return _infinite_like(p.loc)
-
-
 @register_kl(Laplace, Normal)
 def _kl_laplace_normal(p, q):
-    var_normal = q.scale.pow(2)
-    scale_sqr_var_ratio = p.scale.pow(2) / var_normal
-    t1 = 0.5 * torch.log(2 * scale_sqr_var_ratio / math.pi)
-    t2 = 0.5 * p.loc.pow(2)
-    t3 = p.loc * q.loc
-    t4 = 0.5 * q.loc.pow(2)
-    return -t1 + scale_sqr_var_ratio + (t2 - t3 + t4) / var_normal - 1
-
-
-@register_kl(Normal, Beta)
-@register_kl(Normal, Exponential)
-@register_kl(Normal, Gamma)
-@register_kl(Normal, Pareto)
-@register_kl(Normal, Uniform)
-def _kl_normal_infinity(p, q):
-    return _infinite_like(p.loc)
+    scale_ratio = p.scale / q.scale
+    loc_diff_ratio = (p.loc - q.loc) / q.scale
+    t1 = scale_ratio.log() + 0.5 * _log_2_over_pi
+    t2 = scale_ratio.pow(2)
+    t3 = 0.5 * loc_diff_ratio.pow(2)
+    return -t1 + t2 + t3 - 1
 
 
 @register_kl(Normal, Gumbel)
@@ -438,17 +458,11 @@ def _kl_normal_gumbel(p, q):
     t1 = var_scale_sqr_ratio.log() * 0.5
     t2 = mean_scale_ratio - loc_scale_ratio
     t3 = torch.exp(-mean_scale_ratio + 0.5 * var_scale_sqr_ratio + loc_scale_ratio)
-    return -t1 + t2 + t3 - (0.5 * (1 + math.log(2 * math.pi)))
+    return -t1 + t2 + t3 - 0.5 * (1 + _log_2pi)
 
 # TODO: Add Normal-Laplace KL Divergence
 
 
-@register_kl(Pareto, Beta)
-@register_kl(Pareto, Uniform)
-def _kl_pareto_infinity(p, q):
-    return _infinite_like(p.scale)
-
-
 @register_kl(Pareto, Exponential)
 def _kl_pareto_exponential(p, q):
     scale_rate_prod = p.scale * q.rate
@@ -456,8 +470,7 @@ def _kl_pareto_exponential(p, q):
     t2 = p.alpha.reciprocal()
     t3 = p.alpha * scale_rate_prod / (p.alpha - 1)
     result = t1 - t2 + t3 - 1
-    result[p.alpha <= 1] = float('inf')
-    return result
+    return result.masked_fill_(p.alpha <= 1, float('inf'))
 
 
 @register_kl(Pareto, Gamma)
@@ -468,34 +481,32 @@ def _kl_pareto_gamma(p, q):
     t3 = (1 - q.concentration) * common_term
     t4 = q.rate * p.alpha * p.scale / (p.alpha - 1)
     result = t1 + t2 + t3 + t4 - 1
-    result[p.alpha <= 1] = float('inf')
-    return result
+    return result.masked_fill_(p.alpha <= 1, float('inf'))
 
 
 @register_kl(Pareto, Laplace)
 def _kl_pareto_laplace(p, q):
     ct1 = p.alpha / (p.alpha - 1)
     ct2 = q.loc / q.scale
-    ct3 = (p.scale / q.loc).pow(p.alpha)
+    # Clamp the base so that entries where q.loc <= p.scale see ct3 = 1 rather than NaN.
+    ct3 = (p.scale / torch.max(p.scale, q.loc)).pow(p.alpha)
     result = ct1 * p.scale / q.scale - ct2
-    if (p.scale < q.loc).any():
-        result[p.scale < q.loc] += 2 * ct3 * ct2 * (1 - ct1)
-        result[p.scale < q.loc] *= -1
-    result += (2 * p.alpha * q.scale / p.scale).log() - 1 - p.alpha.reciprocal()
-    return result
+    mask = (p.scale < q.loc).type_as(result)
+    correction = 2 * ct3 * ct2 * (1 - ct1) * mask
+    result = (result + correction) * (1 - 2 * mask)
+    return result + (2 * p.alpha * q.scale / p.scale).log() - 1 - p.alpha.reciprocal()
 
 
 @register_kl(Pareto, Normal)
 def _kl_pareto_normal(p, q):
     var_normal = 2 * q.scale.pow(2)
     common_term = p.scale / (p.alpha - 1)
-    t1 = (math.sqrt(2 * math.pi) * q.scale * p.alpha / p.scale).log()
+    t1 = (q.scale * p.alpha / p.scale).log() + 0.5 * _log_2pi
     t2 = p.alpha.reciprocal()
     t3 = p.alpha * common_term.pow(2) / (p.alpha - 2)
     t4 = (p.alpha * common_term - q.loc).pow(2)
     result = t1 - t2 + (t3 + t4) / var_normal - 1
-    result[p.alpha <= 2] = float('inf')
-    return result
+    return result.masked_fill_(p.alpha <= 2, float('inf'))
 
 
 @register_kl(Uniform, Beta)
@@ -506,15 +517,13 @@ def _kl_uniform_beta(p, q):
     t3 = (q.concentration0 - 1) * (_x_log_x((1 - p.high)) - _x_log_x((1 - p.low)) + common_term) / common_term
     t4 = q.concentration1.lgamma() + q.concentration0.lgamma() - (q.concentration1 + q.concentration0).lgamma()
     result = t3 + t4 - t1 - t2
-    result[(p.high > q.support.upper_bound) | (p.low < q.support.lower_bound)] = float('inf')
-    return result
+    return result.masked_fill_((p.high > q.support.upper_bound) | (p.low < q.support.lower_bound), float('inf'))
 
 
 @register_kl(Uniform, Exponential)
 def _kl_uniform_exponetial(p, q):
     result = q.rate * (p.high + p.low) / 2 - ((p.high - p.low) * q.rate).log()
-    result[p.low < q.support.lower_bound] = float('inf')
-    return result
+    return result.masked_fill_(p.low < q.support.lower_bound, float('inf'))
 
 
 @register_kl(Uniform, Gamma)
@@ -525,8 +534,7 @@ def _kl_uniform_gamma(p, q):
     t3 = (1 - q.concentration) * (_x_log_x(p.high) - _x_log_x(p.low) - common_term) / common_term
     t4 = q.rate * (p.high + p.low) / 2
     result = -t1 + t2 + t3 + t4
-    result[p.low < q.support.lower_bound] = float('inf')
-    return result
+    return result.masked_fill_(p.low < q.support.lower_bound, float('inf'))
 
 
 @register_kl(Uniform, Gumbel)
@@ -544,7 +552,7 @@ def _kl_uniform_gumbel(p, q):
 @register_kl(Uniform, Normal)
 def _kl_uniform_normal(p, q):
     common_term = p.high - p.low
-    t1 = (math.sqrt(math.pi * 2) * q.scale / common_term).log()
+    t1 = (q.scale / common_term).log() + 0.5 * _log_2pi
     t2 = (common_term).pow(2) / 12
     t3 = ((p.high + p.low - 2 * q.loc) / 2).pow(2)
     return t1 + 0.5 * (t2 + t3) / q.scale.pow(2)
@@ -556,5 +564,4 @@ def _kl_uniform_pareto(p, q):
     t1 = (q.alpha * q.scale.pow(q.alpha) * (support_uniform)).log()
     t2 = (_x_log_x(p.high) - _x_log_x(p.low) - support_uniform) / support_uniform
     result = t2 * (q.alpha + 1) - t1
-    result[p.low < q.support.lower_bound] = float('inf')
-    return result
+    return result.masked_fill_(p.low < q.scale, float('inf'))